@@ -1,10 +1,10 @@
 
 from fastapi import Request, Response
 
-from stores.cookie_transaction_store import CookieTransactionStore
-from stores.stateless_state_store import StatelessStateStore
+from ..stores.cookie_transaction_store import CookieTransactionStore
+from ..stores.stateless_state_store import StatelessStateStore
 
-from config import Auth0Config
+from ..config import Auth0Config
 
 #Imported from auth0-server-python
 from auth_server.server_client import ServerClient
@@ -23,7 +23,7 @@ class AuthClient:
     def __init__(self, config: Auth0Config, state_store=None, transaction_store=None):
         self.config = config
         # Build the redirect URI based on the provided app_base_url
-        redirect_uri =  f"{str(config.app_base_url).rstrip('/')}/auth/callback"
+        redirect_uri =  f"{config.app_base_url_str.rstrip('/')}/auth/callback"
         
         # Use provided state_store or default to an in-memory implementation
         if state_store is None:
@@ -54,7 +54,7 @@ class AuthClient:
         Optionally, an app_state dictionary can be passed to persist additional state.
         Returns the authorization URL to redirect the user.
         """
-        options = StartInteractiveLoginOptions(app_state=app_state)
+        options = StartInteractiveLoginOptions.model_construct(app_state=app_state)
         return await self.client.start_interactive_login(options, store_options=store_options)
     
     async def complete_login(self, callback_url: str, store_options: dict = None) -> dict:
@@ -69,7 +69,7 @@ class AuthClient:
         Initiates logout by clearing the session and generating a logout URL.
         Optionally accepts a return_to URL for redirection after logout.
         """
-        options = LogoutOptions(return_to=return_to)
+        options = LogoutOptions.model_construct(return_to=return_to)
         return await self.client.logout(options, store_options=store_options)
     
     async def handle_backchannel_logout(self, logout_token: str) -> None:
@@ -1,14 +1,17 @@
-from pydantic import BaseModel, AnyUrl, Field
+from functools import cached_property
+from pydantic import BaseModel, HttpUrl, ConfigDict, Field, computed_field
 from typing import Optional, Dict, Any
 
 class Auth0Config(BaseModel):
     """
     Configuration settings for the FastAPI SDK integrating auth0-server-python.
     """
+    model_config = ConfigDict(populate_by_name=True, frozen=True, revalidate_instances="never")
+
     domain: str
     client_id: str = Field(..., alias="clientId")
     client_secret: str = Field(..., alias="clientSecret")
-    app_base_url: AnyUrl = Field(..., alias="appBaseUrl", description="Base URL of your application (e.g., https://example.com)")
+    app_base_url: HttpUrl = Field(..., alias="appBaseUrl", description="Base URL of your application (e.g., https://example.com)")
     secret: str = Field(..., description="Secret used for encryption and signing cookies")
     audience: Optional[str] = Field(None, description="Target audience for tokens (if applicable)")
     authorization_params: Optional[Dict[str, Any]] = Field(None, description="Additional parameters to include in the authorization request")
@@ -19,6 +22,15 @@ class Auth0Config(BaseModel):
     #Cookie Settings
     cookie_name: str = Field("_a0_session", description="Name of the cookie storing session data")
     session_expiration: int = Field(259200, description="Session expiration time in seconds (default: 3 days)")
+    session_cache_ttl: float = Field(0, description="Seconds to cache profile/token lookups per session cookie (0, the default, disables). Cached entries are not invalidated by logout or server-side session changes")
+    debug: bool = Field(False, description="Include access token previews in /auth/token and /auth/connection responses")
+
+    @computed_field
+    @cached_property
+    def app_base_url_str(self) -> str:
+        """
+        String form of app_base_url, computed once since the config is frozen.
+        Uses the ASCII (punycode) form so it stays valid in Location headers.
+        """
+        return str(self.app_base_url)
 
-    class Config:
-        populate_by_name = True
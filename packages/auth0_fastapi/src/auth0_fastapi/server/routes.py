@@ -0,0 +1,304 @@
+import hashlib
+import logging
+import orjson
+from fastapi import APIRouter, Request, Response, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from typing import Any, Optional, Tuple
+from urllib.parse import quote
+from ..auth.auth_client import AuthClient
+from ..config import Auth0Config
+from ..util import to_safe_redirect, create_route_url, TTLCache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Characters RedirectResponse leaves unescaped in the Location header
+_LOCATION_SAFE = ":/%#?=@[]!$&'()*+,;"
+
+# Constant /auth/token body for sessions without an access token
+_NO_TOKEN_BODY = orjson.dumps({
+    "access_token_available": False,
+    "access_token_preview": None,
+    "status": "success"
+})
+
+def _merge_set_cookies(src: Response, dst: Response) -> None:
+    """
+    Copies the raw Set-Cookie headers from `src` onto `dst` in a single splice,
+    without re-encoding each cookie through MutableHeaders.
+    """
+    # FastAPI's injected response starts with no raw headers at all, so an empty
+    # list means no store set a cookie and there is nothing to scan.
+    if not src.raw_headers:
+        return
+    dst.raw_headers.extend([(k, v) for (k, v) in src.raw_headers if k == b"set-cookie"])
+
+def _redirect_with_cookies(url: str, src: Response, vetted: bool = False) -> Response:
+    """
+    Builds a 307 redirect to `url` that carries the Set-Cookie headers from `src`.
+    The raw header list is assembled directly rather than through RedirectResponse,
+    keeping the content-length: 0 that Response adds so the empty body needs no chunked framing.
+    Pass vetted=True for URLs the SDK built itself (already percent-encoded) to skip
+    quoting them again.
+    """
+    location = url if vetted else quote(url, safe=_LOCATION_SAFE)
+    redirect_response = Response(status_code=307)
+    redirect_response.raw_headers.append((b"location", location.encode("latin-1")))
+    _merge_set_cookies(src, redirect_response)
+    return redirect_response
+
+def _session_cache_key(request: Request, *parts: str) -> Optional[Tuple[Any, ...]]:
+    """
+    Builds a cache key from `parts` and a digest of the request's Cookie header.
+    Returns None when the request carries no cookies, so nothing is cached.
+    """
+    cookie = request.headers.get("cookie")
+    if not cookie:
+        return None
+    return (*parts, hashlib.blake2b(cookie.encode("latin-1"), digest_size=16).digest())
+
+def register_auth_routes(router: APIRouter, config: Auth0Config, auth_client: AuthClient):
+    """
+    Conditionally register auth routes based on config.mount_routes and config.mount_connect_routes.
+    The route handlers close over config and auth_client rather than resolving them per request.
+    """
+    logger.debug("Registering auth routes: domain=%s cookie=%s", config.domain, config.cookie_name)
+    # Short-lived cache of session lookups, keyed by the request cookies. Entries are
+    # only written when the lookup did not set any cookie (e.g. after a token refresh).
+    session_cache = TTLCache(config.session_cache_ttl)
+    # Token previews are only built when the debug flag is set
+    debug = config.debug
+    if config.mount_routes:
+        @router.get("/auth/login", response_model=None)
+        async def login(request: Request, response: Response) -> Response:
+            """
+            Endpoint to initiate the login process.
+            Optionally accepts a 'returnTo' query parameter and passes it as part of the app state.
+            Redirects the user to the Auth0 authorization URL.
+            """
+        
+            return_to: Optional[str] = request.query_params.get("returnTo")
+            auth_url = await auth_client.start_login( 
+                app_state={"returnTo": return_to} if return_to else None,
+                store_options={"response": response}
+            )
+
+            return _redirect_with_cookies(auth_url, response, vetted=True)
+
+        @router.get("/auth/callback", response_model=None)
+        async def callback(request: Request, response: Response) -> Response:
+            """
+            Endpoint to handle the callback after Auth0 authentication.
+            Processes the callback URL and completes the login flow.
+            Redirects the user to a post-login URL based on appState or a default.
+            """
+            full_callback_url = str(request.url)
+            try:
+                session_data = await auth_client.complete_login(full_callback_url, store_options={"request": request, "response": response})
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
+            # Extract the returnTo URL from the appState if available.
+            return_to = session_data.get("app_state", {}).get("returnTo")
+            
+            default_redirect = config.app_base_url_str
+            
+            # Redirect, merging Set-Cookie headers from the original response
+            return _redirect_with_cookies(return_to or default_redirect, response, vetted=not return_to)
+
+        @router.get("/auth/logout", response_model=None)
+        async def logout(request: Request, response: Response) -> Response:
+            """
+            Endpoint to handle logout.
+            Clears the session cookie (if applicable) and generates a logout URL,
+            then redirects the user to Auth0's logout endpoint.
+            """
+            return_to: Optional[str] = request.query_params.get("returnTo")
+            try:
+                logout_url = await auth_client.logout(return_to=config.app_base_url_str, store_options={"response": response})
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+            
+            # Redirect, merging cookie deletion headers from the original response
+            return _redirect_with_cookies(logout_url, response, vetted=True)
+
+        @router.post("/auth/backchannel-logout", response_model=None)
+        async def backchannel_logout(request: Request) -> Response:
+            """
+            Endpoint to process backchannel logout notifications.
+            Expects a JSON body with a 'logout_token'.
+            Returns 204 No Content on success.
+            """
+            try:
+                body = orjson.loads(await request.body())
+            except orjson.JSONDecodeError:
+                raise HTTPException(status_code=400, detail="Request body is not valid JSON.")
+            logout_token = body.get("logout_token")
+            if not logout_token:
+                raise HTTPException(status_code=400, detail="Missing 'logout_token' in request body.")
+            
+            try:
+                await auth_client.handle_backchannel_logout(logout_token)
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return Response(status_code=204)
+        
+        #################### Testing Route ###################################
+        @router.get("/auth/profile", response_class=ORJSONResponse, response_model=None)
+        async def profile(request: Request, response:Response) -> Response:
+            cache_key = _session_cache_key(request, "profile")
+            cached = session_cache.get(cache_key) if cache_key else None
+            if cached is None:
+                # Prepare store_options with the Request object (used by the state store to read cookies)
+                store_options = {"request": request, "response": response}
+                try:
+                    # Retrieve user information and session data from the state store
+                    user = await auth_client.client.get_user(store_options=store_options)
+                    session = await auth_client.client.get_session(store_options=store_options)
+                except Exception as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+                if cache_key and not response.raw_headers:
+                    session_cache.set(cache_key, (user, session))
+            else:
+                user, session = cached
+
+            # Return an ORJSONResponse directly to skip jsonable_encoder,
+            # carrying over any cookies the state store set on `response`
+            json_response = ORJSONResponse({
+                "user": user,
+                "session": session
+            })
+            json_response.raw_headers.extend(response.raw_headers)
+            return json_response
+
+
+        @router.get("/auth/token", response_class=ORJSONResponse, response_model=None)
+        async def get_token(request: Request, response: Response) -> Response:
+            cache_key = _session_cache_key(request, "token")
+            # Prepare store_options with the Request object (used by the state store to read cookies)
+            store_options = {"request": request, "response": response}
+            try:
+                # Retrieve access token from the client, unless recently cached for these cookies
+                access_token = session_cache.get(cache_key) if cache_key else None
+                if access_token is None:
+                    access_token = await auth_client.client.get_access_token(store_options=store_options)
+                    if cache_key and not response.raw_headers:
+                        session_cache.set(cache_key, access_token)
+                
+                if not access_token:
+                    json_response = Response(content=_NO_TOKEN_BODY, media_type="application/json")
+                    json_response.raw_headers.extend(response.raw_headers)
+                    return json_response
+
+                # You might want to include some basic information about the token
+                # without exposing the full token in the response
+                json_response = ORJSONResponse({
+                    "access_token_available": True,
+                    "access_token_preview": f"{access_token[:10]}..." if debug else None,
+                    "status": "success"
+                })
+                json_response.raw_headers.extend(response.raw_headers)
+                return json_response
+            except Exception as e:
+                # Handle all errors with a single exception handler
+                raise HTTPException(status_code=400, detail=str(e))
+
+
+        @router.get("/auth/connection/{connection_name}", response_class=ORJSONResponse, response_model=None)
+        async def get_connection_token(
+            connection_name: str,
+            request: Request, 
+            response: Response, 
+            login_hint: Optional[str] = None
+        ) -> Response:
+            # Prepare store_options with the Request and Response objects
+            store_options = {"request": request, "response": response}
+            
+            try:
+                # Create connection options as a dictionary
+                connection_options = {
+                    "connection": connection_name
+                }
+                
+                # Add login_hint if provided
+                if login_hint:
+                    connection_options["login_hint"] = login_hint
+                    
+                # Retrieve connection-specific access token, unless recently cached for these cookies
+                cache_key = _session_cache_key(request, "connection", connection_name, login_hint or "")
+                access_token = session_cache.get(cache_key) if cache_key else None
+                if access_token is None:
+                    access_token = await auth_client.client.get_access_token_for_connection(
+                        connection_options, 
+                        store_options=store_options
+                    )
+                    if cache_key and not response.raw_headers:
+                        session_cache.set(cache_key, access_token)
+                
+                # Return a response with token information
+                json_response = ORJSONResponse({
+                    "connection": connection_name,
+                    "access_token_available": bool(access_token),
+                    "access_token_preview": f"{access_token[:10]}..." if debug and access_token else None,
+                    "status": "success"
+                })
+                json_response.raw_headers.extend(response.raw_headers)
+                return json_response
+            except Exception as e:
+                # Handle all errors with a single exception handler
+                raise HTTPException(status_code=400, detail=str(e))
+        
+    if config.mount_connect_routes:
+        # The callback URL for linking only depends on the fixed base URL
+        connect_callback_uri = create_route_url("/auth/connect/callback", config.app_base_url_str)
+
+        @router.get("/auth/connect", response_model=None)
+        async def connect(request: Request, response: Response,  
+            connection: Optional[str] = Query(None),
+            connectionScope: Optional[str] = Query(None),
+            returnTo: Optional[str] = Query(None)) -> Response:
+
+            # Query parameters (connection, connectionScope, returnTo) are already parsed by FastAPI
+            connection_scope = connectionScope
+            dangerous_return_to = returnTo
+
+            if not connection:
+                raise HTTPException(
+                    status_code=400,
+                    detail="connection is not set"
+                )
+            
+            sanitized_return_to = to_safe_redirect(dangerous_return_to or "/", config.app_base_url_str)
+            
+            # Call the startLinkUser method on our AuthClient. This method should accept parameters similar to:
+            # connection, connectionScope, authorizationParams (with redirect_uri), and appState.
+            link_user_url = await auth_client.start_link_user({
+                "connection": connection,
+                "connectionScope": connection_scope,
+                "authorization_params": {
+                    "redirect_uri": connect_callback_uri
+                },
+                "app_state": {
+                    "returnTo": sanitized_return_to
+                }
+            }, store_options={"request": request, "response": response})
+
+            return _redirect_with_cookies(link_user_url, response, vetted=True)
+
+        @router.get("/auth/connect/callback", response_model=None)
+        async def connect_callback(request: Request, response: Response) -> Response:
+            # Use the full URL from the callback
+            callback_url = str(request.url)
+            try:
+                result = await auth_client.complete_link_user(request, callback_url, store_options={"request": request, "response": response})
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
+            # Retrieve the returnTo parameter from appState if available
+            return_to = result.get("appState", {}).get("returnTo")
+            app_base_url = config.app_base_url_str
+
+            # Redirect, merging Set-Cookie headers from the original response
+            return _redirect_with_cookies(return_to or app_base_url, response, vetted=not return_to)
+
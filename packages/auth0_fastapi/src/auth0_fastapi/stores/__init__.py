@@ -0,0 +1,32 @@
+"""
+Store implementations for auth0-fastapi.
+These stores adapt the core auth0-server-python stores to work with FastAPI.
+
+Implementations are imported lazily on first attribute access, so importing one
+store module does not pull in the others.
+"""
+
+import importlib
+
+_LAZY = {
+    "CookieTransactionStore": ".cookie_transaction_store",
+    "StatefulStateStore": ".stateful_state_store",
+    "StatelessStateStore": ".stateless_state_store",
+}
+
+__all__ = [
+    "CookieTransactionStore",
+    "StatefulStateStore",
+    "StatelessStateStore"
+]
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
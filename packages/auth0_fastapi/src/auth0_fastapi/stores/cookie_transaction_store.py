@@ -1,6 +1,10 @@
 from fastapi import Request, Response
+from jwcrypto.common import JWException
+from pydantic import BaseModel
 from typing import Any, Dict, Optional
 
+from ..util import require_store_option
+
 #Imported from auth0-server-python
 from store.abstract import TransactionStore
 from auth_types import TransactionData
@@ -11,6 +15,8 @@ class CookieTransactionStore(TransactionStore):
     This store expects the FastAPI Request and Response objects to be provided in the
     store_options parameter.
     """
+    __slots__ = ("cookie_name",)
+
     def __init__(self, secret: str, cookie_name: str = "_a0_tx"):
         super().__init__({"secret": secret})
         self.cookie_name = cookie_name
@@ -25,13 +31,11 @@ class CookieTransactionStore(TransactionStore):
         Encrypts and stores the transaction data in a cookie.
         Expects 'response' in options.
         """
-        if options is None or "response" not in options:
-            raise ValueError("Response object is required in store options for cookie storage.")
-        
-        response: Response = options["response"]
+        response: Response = require_store_option(options, "response", "cookie")
     
         # Encrypt the transaction data using the abstract store method:
-        encrypted_value = self.encrypt(identifier, value.dict())
+        payload = value.model_dump_json() if isinstance(value, BaseModel) else value
+        encrypted_value = self.encrypt(identifier, payload)
         # Set cookie with a short max_age (e.g., 60 seconds for transactions)
         response.set_cookie(key=self.cookie_name, value=encrypted_value, path="/",samesite="Lax", secure=True, httponly=True, max_age=60)
 
@@ -44,10 +48,7 @@ class CookieTransactionStore(TransactionStore):
         Retrieves and parses the transaction data from the cookie.
         Expects 'request' in options.
         """
-        if options is None or "request" not in options:
-            raise ValueError("Request object is required in store options for cookie storage.")
-        
-        request: Request = options["request"]
+        request: Request = require_store_option(options, "request", "cookie")
         encrypted_value = request.cookies.get(self.cookie_name)
         if not encrypted_value:
             return None
@@ -55,8 +56,11 @@ class CookieTransactionStore(TransactionStore):
         try:
             # Decrypt the stored value using the abstract store's decrypt method:
             decrypted_data = self.decrypt(identifier, encrypted_value)
-            return TransactionData.parse_obj(decrypted_data)
-        except Exception:
+            # The JWE is authenticated and was written by set() from a TransactionData,
+            # so the payload is rebuilt without running validation again
+            return TransactionData.model_construct(**decrypted_data)
+        except (JWException, ValueError, TypeError):
+            # Undecryptable or malformed transaction cookies are treated as absent
             return None
 
     async def delete(
@@ -68,8 +72,5 @@ class CookieTransactionStore(TransactionStore):
         Deletes the transaction cookie.
         Expects 'response' in options.
         """
-        if options is None or "response" not in options:
-            raise ValueError("Response object is required in store options for cookie storage.")
-        
-        response: Response = options["response"]
+        response: Response = require_store_option(options, "response", "cookie")
         response.delete_cookie(key=self.cookie_name)
@@ -1,26 +1,48 @@
+import asyncio
+from operator import itemgetter
 from typing import Any, Dict, Optional
 from fastapi import Request, Response
+from pydantic import ValidationError
+
+from ..util import require_store_option
 
 #Imported from auth0-server-python
 from store.abstract import StateStore
 from auth_types import StateData
 
+_get_sub_sid = itemgetter("sub", "sid")
+
 class StatefulStateStore(StateStore):
     """
     A state store implementation that persists session data in a backend store
     (for example, Redis or a database). It uses a cookie to keep track of the session ID.
     
     The underlying session store must implement asynchronous get, set, delete, and keys methods.
+    Calls are issued one at a time unless scan_concurrency is raised, which requires the
+    store to accept that many concurrent operations (a connection pool, not a single connection).
     """
-    def __init__(self, secret: str, store: Any, cookie_name: str = "_a0_session", expiration: int = 259200):
+    __slots__ = ("secret", "store", "cookie_name", "expiration", "scan_concurrency")
+
+    def __init__(
+        self,
+        secret: str,
+        store: Any,
+        cookie_name: str = "_a0_session",
+        expiration: int = 259200,
+        scan_concurrency: int = 1
+    ):
         """
         :param secret: Secret for encryption (if needed)
         :param store: The persistent session store (e.g., a Redis client wrapper)
         :param cookie_name: Name of the cookie holding the session identifier
         :param expiration: Session expiration time in seconds
+        :param scan_concurrency: Maximum number of concurrent store calls during a back-channel logout scan
         """
+        if scan_concurrency < 1:
+            raise ValueError("scan_concurrency must be at least 1.")
         self.secret = secret
         self.store = store
+        self.scan_concurrency = scan_concurrency
         self.cookie_name = cookie_name
         self.expiration = expiration
 
@@ -35,10 +57,7 @@ class StatefulStateStore(StateStore):
         Stores state data in the underlying session store and sets a cookie with the session ID.
         Expects 'response' in options.
         """
-        if options is None or "response" not in options:
-            raise ValueError("Response object is required in store options for stateful storage.")
-        
-        response: Response = options["response"]
+        response: Response = require_store_option(options, "response", "stateful")
         # Store the JSON representation. In a real implementation, encrypt if needed.
         data = state.json()
         await self.store.set(identifier, data, expire=self.expiration)
@@ -53,10 +72,7 @@ class StatefulStateStore(StateStore):
         Retrieves state data from the underlying session store using the session cookie.
         Expects 'request' in options.
         """
-        if options is None or "request" not in options:
-            raise ValueError("Request object is required in store options for stateful storage.")
-        
-        request = options["request"]
+        request = require_store_option(options, "request", "stateful")
         session_id = request.cookies.get(self.cookie_name)
         if not session_id:
             return None
@@ -66,8 +82,8 @@ class StatefulStateStore(StateStore):
             return None
         
         try:
-            return StateData.parse_obj(data)
-        except Exception:
+            return StateData.model_validate_json(data)
+        except ValidationError:
             return None
 
     async def delete(
@@ -79,10 +95,7 @@ class StatefulStateStore(StateStore):
         Deletes state data from the session store and clears the session cookie.
         Expects 'response' in options.
         """
-        if options is None or "response" not in options:
-            raise ValueError("Response object is required in store options for stateful storage.")
-        
-        response: Response = options["response"]
+        response: Response = require_store_option(options, "response", "stateful")
         await self.store.delete(identifier)
         response.delete_cookie(key=self.cookie_name)
     
@@ -95,16 +108,33 @@ class StatefulStateStore(StateStore):
         Iterates over the session store keys and deletes sessions matching the logout token claims.
         This method assumes the underlying store provides a 'keys' method.
         """
+        # Sessions always carry both a sub and a sid, so incomplete claims can't match anything
+        try:
+            sub, sid = _get_sub_sid(claims)
+        except KeyError:
+            return
+        if not (sub and sid):
+            return
+
         # Example assumes the session store has an async keys() method.
-        session_keys = await self.store.keys()
-        for key in session_keys:
-            data = await self.store.get(key)
-            if data:
+        session_keys = list(await self.store.keys())
+        to_delete = []
+        # Fetch sessions in batches of scan_concurrency concurrent gets
+        batch_size = self.scan_concurrency
+        for start in range(0, len(session_keys), batch_size):
+            batch = session_keys[start:start + batch_size]
+            values = await asyncio.gather(*(self.store.get(key) for key in batch))
+            for key, data in zip(batch, values):
+                if not data:
+                    continue
                 try:
-                    state = StateData.parse_raw(data)
-                    internal = state.internal.dict() if state.internal else {}
-                    user = state.user.dict() if state.user else {}
-                    if internal.get("sid") == claims.get("sid") and user.get("sub") == claims.get("sub"):
-                        await self.store.delete(key)
+                    state = StateData.model_validate_json(data)
+                    # Compare on the parsed models directly instead of dumping them back to dicts
+                    if state.internal.sid == sid and state.user is not None and state.user.sub == sub:
+                        to_delete.append(key)
                 except Exception:
-                    await self.store.delete(key)
+                    to_delete.append(key)
+
+        # Issue the deletes once the scan is done, with the same concurrency limit as the gets
+        for start in range(0, len(to_delete), batch_size):
+            await asyncio.gather(*(self.store.delete(key) for key in to_delete[start:start + batch_size]))
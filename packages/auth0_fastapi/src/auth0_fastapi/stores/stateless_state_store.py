@@ -1,15 +1,26 @@
+import json
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Union
 from fastapi import Request, Response
+from jwcrypto.common import JWException
+from pydantic import BaseModel
+
+from ..util import require_store_option
 
 #Imported from auth0-server-python
 from store.abstract import StateStore
 from auth_types import StateData
 
+# Number of recently decrypted session cookies kept per store
+_DECRYPT_CACHE_SIZE = 256
+
 class StatelessStateStore(StateStore):
     """
     A stateless state store that encodes session data entirely in a cookie.
     The data is expected to be encrypted and tamper-proof.
     """
+    __slots__ = ("cookie_name", "expiration", "max_cookie_size", "cookie_options", "_decrypted")
+
     def __init__(self, secret: str, cookie_name: str = "_a0_session", expiration: int = 259200):
         super().__init__({"secret": secret})
         self.cookie_name = cookie_name
@@ -25,6 +36,11 @@ class StatelessStateStore(StateStore):
             "max_age": expiration,
         }
 
+        # LRU of decrypted payloads (as JSON text) keyed by the full cookie value, so repeated
+        # requests carrying the same session skip the JWE decrypt. Every hit is parsed into a
+        # fresh object, so callers never share or mutate a cached value.
+        self._decrypted = OrderedDict()
+
     async def set(
         self, 
         identifier: str, 
@@ -35,16 +51,11 @@ class StatelessStateStore(StateStore):
         Stores state data in an encrypted cookie.
         Expects 'response' in options.
         """
-        if options is None or "response" not in options:
-            raise ValueError("Response object is required in store options for stateless storage.")
-        
-        response: Response = options["response"]
-        if hasattr(state, 'dict') and callable(state.dict):
-            state_dict = state.dict()
-        else:
-            state_dict = state  
+        response: Response = require_store_option(options, "response", "stateless")
+        # Serialize models straight to JSON so encrypt doesn't walk an intermediate dict
+        payload = state.model_dump_json() if isinstance(state, BaseModel) else state
         # Encrypt the transaction data using the abstract store method:
-        encrypted_data = self.encrypt(identifier, state_dict)
+        encrypted_data = self.encrypt(identifier, payload)
         # Calculate chunk size, ensuring space for the key name and additional characters
         chunk_size = self.max_cookie_size - len(self.cookie_name) - 10
         cookies = {}
@@ -72,10 +83,7 @@ class StatelessStateStore(StateStore):
         Retrieves state data from the encrypted cookie.
         Expects 'request' in options.
         """
-        if options is None or "request" not in options:
-            raise ValueError("Request object is required in store options for stateless storage.")
-        
-        request = options["request"]
+        request = require_store_option(options, "request", "stateless")
 
         session_parts = []
         # Extract all cookies that match cookie_prefix
@@ -91,11 +99,21 @@ class StatelessStateStore(StateStore):
         full_encoded_data = "".join(part[1] for part in session_parts)
         if not full_encoded_data:
             return None
+        cache_key = (identifier, full_encoded_data)
+        cached = self._decrypted.get(cache_key)
+        if cached is not None:
+            self._decrypted.move_to_end(cache_key)
+            return json.loads(cached)
+
         try:
             # Decrypt the stored value using the abstract store's decrypt method:
             decrypted_data = self.decrypt(identifier, full_encoded_data)
+            self._decrypted[cache_key] = json.dumps(decrypted_data)
+            if len(self._decrypted) > _DECRYPT_CACHE_SIZE:
+                self._decrypted.popitem(last=False)
             return decrypted_data
-        except Exception:
+        except (JWException, ValueError):
+            # Tampered, truncated or foreign cookies are treated as no session
             return None
         
     async def delete(
@@ -107,10 +125,7 @@ class StatelessStateStore(StateStore):
         Deletes the state cookie and its chunks.
         Expects 'response' in options.
         """
-        if options is None or "response" not in options:
-            raise ValueError("Response object is required in store options for stateless storage.")
-        
-        response: Response = options["response"]
+        response: Response = require_store_option(options, "response", "stateless")
         # Delete the base cookie if it exists
         response.delete_cookie(key=self.cookie_name)
         
@@ -0,0 +1,122 @@
+import time
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+def ensure_no_leading_slash(url: str) -> str:
+    """
+    Removes any leading slash from the given URL string.
+    """
+    return url.lstrip('/')
+
+def ensure_trailing_slash(base: str) -> str:
+    """
+    Ensures that the base URL ends with a slash.
+    """
+    base_str = str(base)
+    return base_str if base_str.endswith('/') else base_str + '/'
+
+def create_route_url(url: str, base: str) -> str:
+    """
+    Ensures route URLs are created correctly by removing the leading slash from the 
+    provided URL and ensuring the base URL has a trailing slash. Then uses urljoin 
+    to combine them.
+    
+    Args:
+        url: The URL (or path) to use.
+        base: The base URL to use.
+    
+    Returns:
+        A complete URL string combining the base and url.
+    """
+    base_fixed = ensure_trailing_slash(base)
+    url_fixed = ensure_no_leading_slash(url)
+    return urljoin(base_fixed, url_fixed)
+
+@lru_cache(maxsize=16)
+def get_origin(base_url: str) -> str:
+    """
+    Returns the origin (scheme://netloc) of the given base URL.
+    The result is cached, as the base URL is fixed for the lifetime of the app.
+    """
+    parts = urlsplit(base_url)
+    return parts.scheme + "://" + parts.netloc
+
+def to_safe_redirect(dangerous_redirect: str, safe_base_url: str) -> Optional[str]:
+    """
+    Ensures that the redirect URL is safe to use by verifying that its origin matches 
+    the origin of the safe_base_url.
+    
+    Args:
+        dangerous_redirect: The redirect URL to check.
+        safe_base_url: The base URL to check against.
+        
+    Returns:
+        A safe redirect URL string if the origins match, or None otherwise.
+    """
+    try:
+        # Ensure safe_base_url is a string.
+        safe_base_url_str = str(safe_base_url)
+        route_url = create_route_url(dangerous_redirect, safe_base_url_str)
+    except Exception:
+        return None
+
+    # Build origins from string values
+    route_parts = urlsplit(route_url)
+    route_origin = route_parts.scheme + "://" + route_parts.netloc
+
+    if route_origin == get_origin(safe_base_url_str):
+        return route_url
+    return None
+
+def require_store_option(options: Optional[Dict[str, Any]], name: str, storage: str) -> Any:
+    """
+    Returns the given entry (e.g. "request" or "response") from a store's options.
+
+    Args:
+        options: The store_options passed to the store method.
+        name: The key to look up.
+        storage: Storage kind used in the error message (e.g. "cookie").
+
+    Raises:
+        ValueError: If options is missing or does not contain the entry.
+    """
+    try:
+        return options[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"{name.capitalize()} object is required in store options for {storage} storage.") from None
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire `ttl` seconds after being set.
+    Once `maxsize` entries are held, the oldest entry is evicted on insert.
+    A ttl of 0 or less disables the cache. It performs no locking and is meant
+    to be used from a single event loop.
+    """
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns the cached value for key, or None if it is missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Caches value under key for the configured ttl.
+        """
+        if self.ttl <= 0:
+            return
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
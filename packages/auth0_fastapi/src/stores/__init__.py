@@ -1,14 +0,0 @@
-"""
-Store implementations for auth0-fastapi.
-These stores adapt the core auth0-server-python stores to work with FastAPI.
-"""
-
-from .cookie_transaction_store import CookieTransactionStore
-from .stateful_state_store import StatefulStateStore
-from .stateless_state_store import StatelessStateStore
-
-__all__ = [
-    "CookieTransactionStore",
-    "StatefulStateStore",
-    "StatelessStateStore"
-]
@@ -3,12 +3,12 @@ import uvicorn
 from fastapi import FastAPI, Request, Response, APIRouter, Depends
 from starlette.middleware.sessions import SessionMiddleware
 
-from .config import Auth0Config
+from auth0_fastapi.config import Auth0Config
 import json
 
-from .auth.auth_client import AuthClient
-from .server.routes import router, register_auth_routes
-from .errors import register_exception_handlers
+from auth0_fastapi.auth.auth_client import AuthClient
+from auth0_fastapi.server.routes import router, register_auth_routes
+from auth0_fastapi.errors import register_exception_handlers
 
 
 # Create FastAPI app instance
@@ -32,6 +32,7 @@ config = Auth0Config(
     cookie_name="auth0_session",
     authorization_params={"scope":"openid profile email offline_access", "response_type":"code", "access_type":"offline", "grant_type":"authorization_code", "prompt": "consent"},
     session_expiration=259200,  # 3 days in seconds
+    debug=True,
 )
 
 # Store the configuration in app state for access in routes, if needed
@@ -41,7 +42,7 @@ app.state.config = config
 auth_client = AuthClient(config)
 app.state.auth_client = auth_client
 
-register_auth_routes(router, config)
+register_auth_routes(router, config, auth_client)
 
 # Include the authentication routes
 app.include_router(router)
@@ -49,9 +50,11 @@ app.include_router(router)
 # Register custom exception handlers for Auth0 errors
 register_exception_handlers(app)
 
+_INDEX_BODY = b'{"message":"Hello from test_script.py!"}'
+
 @app.get("/")
 def index():
-    return {"message": "Hello from test_script.py!"}
+    return Response(content=_INDEX_BODY, media_type="application/json")
 
 #############Back Channel Testing Code #########################
 
@@ -113,8 +116,17 @@ def index():
 # app.include_router(router)
 
 if __name__ == "__main__":
-    # Run the application using Uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Run the application using Uvicorn on uvloop + httptools. Multiple workers
+    # require an import string, so the app is referenced by module path.
+    module_name = __spec__.name if __spec__ else os.path.splitext(os.path.basename(__file__))[0]
+    uvicorn.run(
+        f"{module_name}:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
 
 
 
@@ -0,0 +1,125 @@
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from auth0_fastapi.config import Auth0Config
+from auth0_fastapi.server.routes import register_auth_routes
+
+
+def make_app(auth_client, **config_overrides) -> FastAPI:
+    config = Auth0Config(
+        domain="auth0.local",
+        clientId="client_id",
+        clientSecret="client_secret",
+        appBaseUrl="https://app.example",
+        secret="some-secret",
+        **config_overrides
+    )
+    router = APIRouter()
+    register_auth_routes(router, config, auth_client)
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def get(app: FastAPI, path: str, session_cookie: str):
+    # A fresh client per request, so the cookie jar never carries cookies set by a previous response
+    return TestClient(app, cookies={"_a0_session_0": session_cookie}).get(path)
+
+
+def make_auth_client() -> MagicMock:
+    auth_client = MagicMock()
+    auth_client.client.get_user = AsyncMock(return_value={"sub": "user123"})
+    auth_client.client.get_session = AsyncMock(return_value={"user": {"sub": "user123"}})
+    return auth_client
+
+
+def test_profile_not_cached_by_default():
+    auth_client = make_auth_client()
+    app = make_app(auth_client)
+
+    for _ in range(2):
+        response = get(app, "/auth/profile", "abc")
+        assert response.status_code == 200
+        assert response.json()["user"] == {"sub": "user123"}
+
+    assert auth_client.client.get_user.await_count == 2
+
+
+def test_profile_cached_per_session_cookie_when_enabled():
+    auth_client = make_auth_client()
+    app = make_app(auth_client, session_cache_ttl=60)
+
+    get(app, "/auth/profile", "abc")
+    get(app, "/auth/profile", "abc")
+    assert auth_client.client.get_user.await_count == 1
+
+    # A different session cookie is a different cache entry
+    get(app, "/auth/profile", "def")
+    assert auth_client.client.get_user.await_count == 2
+
+
+def test_profile_lookup_that_sets_cookie_is_not_cached():
+    """
+    When the store rewrites the session cookie during the lookup, the result must
+    not be cached under the old cookie value.
+    """
+    auth_client = make_auth_client()
+
+    async def get_user(store_options=None):
+        store_options["response"].set_cookie(key="_a0_session_0", value="refreshed")
+        return {"sub": "user123"}
+
+    auth_client.client.get_user = AsyncMock(side_effect=get_user)
+    app = make_app(auth_client, session_cache_ttl=60)
+
+    for _ in range(2):
+        response = get(app, "/auth/profile", "abc")
+        assert response.status_code == 200
+        assert "_a0_session_0=refreshed" in response.headers["set-cookie"]
+
+    assert auth_client.client.get_user.await_count == 2
+
+
+@pytest.mark.parametrize("path", ["/auth/token", "/auth/connection/google"])
+def test_token_lookup_that_sets_cookie_is_not_cached(path):
+    auth_client = make_auth_client()
+
+    async def get_token(*args, store_options=None):
+        store_options["response"].set_cookie(key="_a0_session_0", value="refreshed")
+        return "new-access-token"
+
+    auth_client.client.get_access_token = AsyncMock(side_effect=get_token)
+    auth_client.client.get_access_token_for_connection = AsyncMock(side_effect=get_token)
+    app = make_app(auth_client, session_cache_ttl=60)
+
+    for _ in range(2):
+        response = get(app, path, "abc")
+        assert response.status_code == 200
+        assert response.json()["access_token_available"] is True
+
+    assert (
+        auth_client.client.get_access_token.await_count
+        + auth_client.client.get_access_token_for_connection.await_count
+    ) == 2
+
+
+def test_login_redirect_carries_cookies_with_empty_content_length():
+    auth_client = make_auth_client()
+
+    async def start_login(app_state=None, store_options=None):
+        store_options["response"].set_cookie(key="_a0_tx", value="tx")
+        return "https://auth0.local/authorize?client_id=client_id&state=abc"
+
+    auth_client.start_login = AsyncMock(side_effect=start_login)
+    app = make_app(auth_client)
+
+    response = TestClient(app, follow_redirects=False).get("/auth/login")
+
+    assert response.status_code == 307
+    assert response.headers["location"] == "https://auth0.local/authorize?client_id=client_id&state=abc"
+    assert "_a0_tx=tx" in response.headers["set-cookie"]
+    assert response.headers["content-length"] == "0"
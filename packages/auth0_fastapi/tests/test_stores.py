@@ -0,0 +1,154 @@
+import asyncio
+import json
+import pytest
+
+from unittest.mock import MagicMock
+from starlette.responses import Response
+
+from auth0_fastapi.stores.stateful_state_store import StatefulStateStore
+from auth0_fastapi.stores.stateless_state_store import StatelessStateStore
+from auth_types import StateData
+
+
+class FakeSessionStore:
+    """
+    In-memory backend that records, per operation, how many calls were in flight at once.
+    """
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.in_flight = {"set": 0, "get": 0, "delete": 0}
+        self.max_in_flight = {"set": 0, "get": 0, "delete": 0}
+
+    async def _enter(self, op):
+        self.in_flight[op] += 1
+        self.max_in_flight[op] = max(self.max_in_flight[op], self.in_flight[op])
+        await asyncio.sleep(0)
+        self.in_flight[op] -= 1
+
+    async def set(self, key, value, expire=None):
+        await self._enter("set")
+        self.data[key] = value
+
+    async def get(self, key):
+        await self._enter("get")
+        return self.data.get(key)
+
+    async def delete(self, key):
+        await self._enter("delete")
+        self.data.pop(key, None)
+
+    async def keys(self):
+        return list(self.data)
+
+
+def make_request(cookies):
+    request = MagicMock()
+    request.cookies = cookies
+    return request
+
+
+def session_json(sub: str, sid: str) -> str:
+    return json.dumps({"user": {"sub": sub}, "internal": {"sid": sid, "created_at": 1}})
+
+
+@pytest.mark.asyncio
+async def test_stateful_logout_scan_is_sequential_by_default():
+    backend = FakeSessionStore({f"k{i}": session_json("user123", "sid1") for i in range(5)})
+    state_store = StatefulStateStore("secret", backend)
+
+    await state_store.delete_by_logout_token({"sub": "user123", "sid": "sid1"})
+
+    assert backend.data == {}
+    assert backend.max_in_flight["get"] == 1
+    assert backend.max_in_flight["delete"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stateful_logout_scan_respects_scan_concurrency():
+    backend = FakeSessionStore({
+        f"k{i}": session_json("user123", "sid1" if i % 3 == 0 else "sid2") for i in range(10)
+    })
+    state_store = StatefulStateStore("secret", backend, scan_concurrency=3)
+
+    await state_store.delete_by_logout_token({"sub": "user123", "sid": "sid1"})
+
+    assert sorted(backend.data) == sorted(f"k{i}" for i in range(10) if i % 3 != 0)
+    assert 1 < backend.max_in_flight["get"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_stateful_logout_deletes_respect_scan_concurrency():
+    backend = FakeSessionStore({f"k{i}": session_json("user123", "sid1") for i in range(10)})
+    state_store = StatefulStateStore("secret", backend, scan_concurrency=4)
+
+    await state_store.delete_by_logout_token({"sub": "user123", "sid": "sid1"})
+
+    assert backend.data == {}
+    assert 1 < backend.max_in_flight["delete"] <= 4
+
+
+def test_stateful_store_rejects_invalid_scan_concurrency():
+    with pytest.raises(ValueError):
+        StatefulStateStore("secret", FakeSessionStore(), scan_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_stateful_set_then_get_round_trips_state():
+    backend = FakeSessionStore()
+    state_store = StatefulStateStore("secret", backend)
+    state = StateData(
+        user={"sub": "user123"},
+        refresh_token="refresh_token",
+        internal={"sid": "sid1", "created_at": 1}
+    )
+    response = Response()
+
+    await state_store.set("session-id", state, options={"response": response})
+    assert "_a0_session=session-id" in response.headers["set-cookie"]
+
+    result = await state_store.get("session-id", options={"request": make_request({"_a0_session": "session-id"})})
+
+    assert isinstance(result, StateData)
+    assert result.user.sub == "user123"
+    assert result.refresh_token == "refresh_token"
+    assert result.internal.sid == "sid1"
+
+
+@pytest.mark.asyncio
+async def test_stateful_get_returns_none_for_invalid_stored_data():
+    backend = FakeSessionStore({"session-id": "not json"})
+    state_store = StatefulStateStore("secret", backend)
+
+    result = await state_store.get("session-id", options={"request": make_request({"_a0_session": "session-id"})})
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_stateless_get_results_are_independent_copies():
+    """
+    Repeated gets for the same cookie are served from the decrypt cache, but mutating
+    one result must not leak into the next.
+    """
+    state_store = StatelessStateStore("secret")
+    response = Response()
+    await state_store.set(
+        "_a0_session",
+        {"user": {"sub": "user123"}, "internal": {"sid": "sid1", "created_at": 1}},
+        options={"response": response}
+    )
+    cookie_name, cookie_value = response.headers["set-cookie"].split(";", 1)[0].split("=", 1)
+    request = make_request({cookie_name: cookie_value})
+
+    first = await state_store.get("_a0_session", options={"request": request})
+    first["user"]["sub"] = "attacker"
+    first["injected"] = 1
+
+    second = await state_store.get("_a0_session", options={"request": request})
+    third = await state_store.get("_a0_session", options={"request": request})
+
+    assert second == {"user": {"sub": "user123"}, "internal": {"sid": "sid1", "created_at": 1}}
+    assert second is not first
+    assert second is not third
+    assert second["user"] is not third["user"]
+    assert len(state_store._decrypted) == 1
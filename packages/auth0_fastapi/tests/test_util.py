@@ -0,0 +1,50 @@
+import pytest
+
+from unittest.mock import patch
+
+from auth0_fastapi.util import TTLCache
+
+
+def test_ttl_cache_returns_value_until_expiry():
+    cache = TTLCache(ttl=10)
+    with patch("auth0_fastapi.util.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+    with patch("auth0_fastapi.util.time.monotonic", return_value=109.9):
+        assert cache.get("key") == "value"
+
+    with patch("auth0_fastapi.util.time.monotonic", return_value=110.0):
+        assert cache.get("key") is None
+    # Expired entries are dropped on access
+    assert "key" not in cache._data
+
+
+def test_ttl_cache_evicts_oldest_entry_at_maxsize():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_overwrite_does_not_evict():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") == 2
+
+
+@pytest.mark.parametrize("ttl", [0, -1])
+def test_ttl_cache_disabled_for_non_positive_ttl(ttl):
+    cache = TTLCache(ttl=ttl)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert cache._data == {}
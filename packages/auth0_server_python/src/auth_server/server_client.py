@@ -150,8 +150,9 @@ class ServerClient(Generic[TStoreOptions]):
         state = PKCE.generate_random_string(32)
         auth_params["state"] = state
         
-        # Build the transaction data to store
-        transaction_data = TransactionData(
+        # Build the transaction data to store. Every field is generated here,
+        # so skip validation.
+        transaction_data = TransactionData.model_construct(
             code_verifier=code_verifier,
             app_state=options.app_state
         )
@@ -322,7 +323,7 @@ class ServerClient(Generic[TStoreOptions]):
         )
         
         # Store transaction data
-        transaction_data = TransactionData(
+        transaction_data = TransactionData.model_construct(
             code_verifier=code_verifier,
             app_state=options.get("app_state")
         )
@@ -395,7 +396,7 @@ class ServerClient(Generic[TStoreOptions]):
         )
         
         # Store transaction data
-        transaction_data = TransactionData(
+        transaction_data = TransactionData.model_construct(
             code_verifier=code_verifier,
             app_state=options.get("app_state")
         )
@@ -569,9 +570,8 @@ class ServerClient(Generic[TStoreOptions]):
                 "refresh_token": state_data_dict["refresh_token"]
             })
             
-            # Update state data with new token
-            existing_state_data = await self._state_store.get(self._state_identifier, store_options)
-            updated_state_data = State.update_state_data(audience, existing_state_data, token_endpoint_response)
+            # Update state data with new token, reusing the state already loaded above
+            updated_state_data = State.update_state_data(audience, state_data, token_endpoint_response)
             
             # Store updated state
             await self._state_store.set(self._state_identifier, updated_state_data, options=store_options)
@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import Any
+from typing import Any, Union
 
 import json
+from functools import lru_cache
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives import hashes
 from jwcrypto import jwk, jwe
@@ -28,21 +29,31 @@ def derive_encryption_key(secret: bytes, salt: bytes) -> bytes:
     )
     return hkdf.derive(secret)
 
-def encrypt(payload: dict, secret: str, salt: str) -> str:
+@lru_cache(maxsize=256)
+def get_encryption_key(secret: str, salt: str) -> jwk.JWK:
     """
-    Encrypts the given payload into a JWE using the direct algorithm and A256CBC-HS512 encryption.
+    Returns the symmetric JWK derived from the secret and salt.
+    Cached so that HKDF and key construction run once per secret/salt pair
+    instead of on every encrypt/decrypt.
     """
     # Convert secret and salt to bytes
     secret_bytes = secret.encode('utf-8')
     salt_bytes = salt.encode('utf-8')
-        
+
     # Derive the encryption key
     encryption_secret = derive_encryption_key(secret_bytes, salt_bytes)
-        
+
     # Create a symmetric key for JWE. jwcrypto expects the key as a base64url-encoded string.
-    key = jwk.JWK(k=base64url_encode(encryption_secret), kty="oct")
+    return jwk.JWK(k=base64url_encode(encryption_secret), kty="oct")
+
+def encrypt(payload: Union[dict, str], secret: str, salt: str) -> str:
+    """
+    Encrypts the given payload into a JWE using the direct algorithm and A256CBC-HS512 encryption.
+    A str payload is taken to be JSON that was already serialized by the caller.
+    """
+    key = get_encryption_key(secret, salt)
         
-    payload_json = json.dumps(payload)
+    payload_json = payload if isinstance(payload, str) else json.dumps(payload)
         
     # Create a JWE object with the specified header
     jwetoken = jwe.JWE(
@@ -51,7 +62,6 @@ def encrypt(payload: dict, secret: str, salt: str) -> str:
     )
 
     jwetoken.add_recipient(key)
-    c = jwetoken.serialize(compact=True)
         
     # Return the compact serialization of the token
     return jwetoken.serialize(compact=True)
@@ -60,11 +70,7 @@ def decrypt(token: str, secret: str, salt: str) -> dict:
     """
     Decrypts the JWE token back to the original payload.
     """
-    secret_bytes = secret.encode('utf-8')
-    salt_bytes = salt.encode('utf-8')
-        
-    encryption_secret = derive_encryption_key(secret_bytes, salt_bytes)
-    key = jwk.JWK(k=base64url_encode(encryption_secret), kty="oct")
+    key = get_encryption_key(secret, salt)
 
     jwetoken = jwe.JWE()
     jwetoken.deserialize(token)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, Dict, Any
+from typing import Generic, TypeVar, Optional, Dict, Any, Union
 
 from encryption import encrypt, decrypt
 
@@ -10,6 +10,7 @@ class AbstractDataStore(Generic[T], ABC):
     Abstract base class for data stores.
     Provides common functionality for different store implementations.
     """
+    __slots__ = ("_options",)
     
     def __init__(self, options: Dict[str, Any]):
         """
@@ -58,13 +59,13 @@ class AbstractDataStore(Generic[T], ABC):
         """
         pass
     
-    def encrypt(self, identifier: str, state_data: Dict[str, Any]) -> T:
+    def encrypt(self, identifier: str, state_data: Union[Dict[str, Any], str]) -> T:
         """
         Encrypt data before storing.
         
         Args:
             identifier: Unique key used as part of encryption salt
-            state_data: Data to encrypt
+            state_data: Data to encrypt, or its already-serialized JSON string
             
         Returns:
             Encrypted string representation of the data
@@ -90,6 +91,7 @@ class StateStore(AbstractDataStore[Dict[str, Any]]):
     Abstract store for persistent session data.
     Extends AbstractDataStore with logout token functionality.
     """
+    __slots__ = ()
     
     async def delete_by_logout_token(self, claims: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -110,4 +112,4 @@ class TransactionStore(AbstractDataStore[Dict[str, Any]]):
     """
     Abstract store for temporary transaction data during auth flows.
     """
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file